@@ -13,16 +13,18 @@ Metrics computed per article:
 
 Usage:
     uv run analyze_readability.py
+    uv run --with numba analyze_readability.py   # JIT syllable counting
 """
 
-import json
+import itertools
 import math
 import re
-import statistics
 import sys
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 try:
     from wordfreq import zipf_frequency
 except ImportError:
@@ -31,113 +33,163 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "wordfreq"])
     from wordfreq import zipf_frequency
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson not installed: stdlib parser
+    from json import loads as json_loads
+
+try:
+    from numba_kernels import syllable_stats
+except ImportError:  # numba not installed: use the cached pure-Python path
+    syllable_stats = None
+
 
 # ---------------------------------------------------------------------------
 # Text analysis helpers
 # ---------------------------------------------------------------------------
 
-_VOWELS = set("aeiouyAEIOUY")
+# 256-entry byte -> is-vowel table, indexed by the bytes of a word
+_VOWEL_TABLE = bytes(1 if chr(i) in "aeiouyAEIOUY" else 0 for i in range(256))
 _WORD_RE = re.compile(r"[a-zA-Z']+")
+_SENT_RE = re.compile(r"[.!?]+")
+
+# Column order of the per-article metric rows returned by analyze_article
+METRIC_KEYS = ("fk_grade", "dale_chall", "mean_zipf", "pct_rare",
+               "ttr", "pct_poly", "mean_word_len")
+
+
+class _SyllableCache(dict):
+    """token -> syllable count, computed on first lookup.
+
+    __missing__ lets map(_SYL_CACHE.__getitem__, tokens) feed np.fromiter
+    directly: hits stay in C and only new tokens call count_syllables.
+    """
+
+    def __missing__(self, word: str) -> int:
+        n = self[word] = count_syllables(word)
+        return n
+
+
+# Per-token memo tables. Natural-language text reuses a small vocabulary
+# heavily, so each unique token pays for syllable counting and the wordfreq
+# lookup only once per run.
+_SYL_CACHE: dict[str, int] = _SyllableCache()
+_ZIPF_CACHE: dict[str, float] = {}
 
 
 def count_syllables(word: str) -> int:
-    word = word.strip(".,;:!?\"'()[]")
-    if not word:
-        return 1
+    """Syllables in a _WORD_RE token (ASCII letters and apostrophes only).
+
+    Tokens need no punctuation stripping: apostrophes are never vowels, so
+    they only matter for the trailing silent-e check.
+    """
+    # Count vowel-group onsets: a vowel byte whose predecessor is not a vowel
     count = 0
-    prev_vowel = False
-    for ch in word:
-        is_vowel = ch in _VOWELS
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
-    if word.endswith("e") and count > 1:
+    prev = 0
+    for b in word.encode("ascii"):
+        v = _VOWEL_TABLE[b]
+        count += v & ~prev
+        prev = v
+    if count > 1 and word.rstrip("'").endswith("e"):
         count -= 1
     return max(1, count)
 
 
-def analyze_article(text: str) -> dict:
-    """Compute all readability metrics for a single article."""
-    raw_words = text.split()
-    n_words = len(raw_words)
+def analyze_article(text: str) -> tuple[float, ...] | None:
+    """Compute all readability metrics for a single article, in METRIC_KEYS order."""
+    # Alphabetic tokens drive every metric, FK's word and syllable counts
+    # included, so the article is lowercased and tokenized in a single pass;
+    # sentence counting reuses the lowered copy.
+    low = text.lower()
+    alpha_words = _WORD_RE.findall(low)
+    n_words = len(alpha_words)
     if n_words == 0:
         return None
 
-    n_sents = max(1, len(re.findall(r"[.!?]+", text)))
+    n_sents = max(1, sum(1 for _ in _SENT_RE.finditer(low)))
 
-    # Extract alphabetic tokens for vocabulary analysis
-    alpha_words = _WORD_RE.findall(text.lower())
-    n_alpha = len(alpha_words)
-    if n_alpha == 0:
-        return None
+    # Fill the Zipf cache for any new vocabulary, then gather per-token scores
+    # into an array so the reductions below run in NumPy.
+    zipf_cache = _ZIPF_CACHE
+    unique_words = set(alpha_words)
+    for w in unique_words:
+        if w not in zipf_cache:
+            zipf_cache[w] = zipf_frequency(w, "en")
+    zipf_arr = np.fromiter(map(zipf_cache.__getitem__, alpha_words),
+                           dtype=np.float32, count=n_words)
+
+    # Syllable total and polysyllable count
+    if syllable_stats is not None:
+        _, n_syllables, n_poly = syllable_stats(low)
+    else:
+        syl_arr = np.fromiter(map(_SYL_CACHE.__getitem__, alpha_words),
+                              dtype=np.int16, count=n_words)
+        n_syllables = int(syl_arr.sum())
+        n_poly = int(np.count_nonzero(syl_arr >= 3))
 
     # --- FK Grade Level ---
-    n_syllables = sum(count_syllables(w) for w in raw_words)
     fk_grade = 0.39 * (n_words / n_sents) + 11.8 * (n_syllables / n_words) - 15.59
 
     # --- Word frequency metrics (via wordfreq Zipf scale: 0=never, ~7=the) ---
-    zipf_scores = [zipf_frequency(w, "en") for w in alpha_words]
-    mean_zipf = statistics.mean(zipf_scores)
+    mean_zipf = float(zipf_arr.mean(dtype=np.float64))
 
     # % rare words: Zipf < 3.0 roughly corresponds to outside top-5000
-    n_rare = sum(1 for z in zipf_scores if z < 3.0)
-    pct_rare = n_rare / n_alpha
+    n_rare = int((zipf_arr < 3.0).sum())
+    pct_rare = n_rare / n_words
 
     # --- Dale-Chall approximation ---
     # "Familiar" = Zipf >= 4.0 (~top 3000 words)
-    n_unfamiliar = sum(1 for z in zipf_scores if z < 4.0)
-    pct_unfamiliar = (n_unfamiliar / n_alpha) * 100
+    n_unfamiliar = int((zipf_arr < 4.0).sum())
+    pct_unfamiliar = (n_unfamiliar / n_words) * 100
     dale_chall = 0.1579 * pct_unfamiliar + 0.0496 * (n_words / n_sents)
     if pct_unfamiliar > 5:
         dale_chall += 3.6365
 
     # --- Type-Token Ratio ---
-    unique_words = set(alpha_words)
-    ttr = len(unique_words) / n_alpha
+    ttr = len(unique_words) / n_words
 
     # --- % Polysyllabic (3+ syllables) ---
-    n_poly = sum(1 for w in alpha_words if count_syllables(w) >= 3)
-    pct_poly = n_poly / n_alpha
+    pct_poly = n_poly / n_words
 
     # --- Mean word length (characters) ---
-    mean_word_len = statistics.mean(len(w) for w in alpha_words)
+    mean_word_len = sum(map(len, alpha_words)) / n_words
 
-    return {
-        "fk_grade": round(fk_grade, 2),
-        "dale_chall": round(dale_chall, 2),
-        "mean_zipf": round(mean_zipf, 3),
-        "pct_rare": round(pct_rare, 4),
-        "ttr": round(ttr, 4),
-        "pct_poly": round(pct_poly, 4),
-        "mean_word_len": round(mean_word_len, 2),
-        "words": n_words,
-        "sentences": n_sents,
-    }
+    return (
+        round(fk_grade, 2),
+        round(dale_chall, 2),
+        round(mean_zipf, 3),
+        round(pct_rare, 4),
+        round(ttr, 4),
+        round(pct_poly, 4),
+        round(mean_word_len, 2),
+    )
 
 
 # ---------------------------------------------------------------------------
 # Summary statistics
 # ---------------------------------------------------------------------------
 
-def summarize(values: list[float]) -> dict:
-    if not values:
+def summarize(values: np.ndarray) -> dict:
+    n = len(values)
+    if n == 0:
         return {}
-    s = sorted(values)
-    n = len(s)
+    s = np.sort(values)
+    # Percentiles index the sorted array directly (nearest rank, rounded down)
+    p10, p25, p75, p90 = s[[int(n * 0.10), int(n * 0.25), int(n * 0.75), int(n * 0.90)]]
     return {
-        "mean": round(statistics.mean(s), 2),
-        "median": round(statistics.median(s), 2),
-        "stdev": round(statistics.stdev(s), 2) if n > 1 else 0,
-        "p10": round(s[int(n * 0.10)], 2),
-        "p25": round(s[int(n * 0.25)], 2),
-        "p75": round(s[int(n * 0.75)], 2),
-        "p90": round(s[int(n * 0.90)], 2),
-        "min": round(s[0], 2),
-        "max": round(s[-1], 2),
+        "mean": round(float(s.mean(dtype=np.float64)), 2),
+        "median": round(float(np.median(s)), 2),
+        "stdev": round(float(s.std(ddof=1, dtype=np.float64)), 2) if n > 1 else 0,
+        "p10": round(float(p10), 2),
+        "p25": round(float(p25), 2),
+        "p75": round(float(p75), 2),
+        "p90": round(float(p90), 2),
+        "min": round(float(s[0]), 2),
+        "max": round(float(s[-1]), 2),
     }
 
 
-def print_comparison(metric_name: str, easy_vals: list[float], hard_vals: list[float]):
+def print_comparison(metric_name: str, easy_vals: np.ndarray, hard_vals: np.ndarray):
     e = summarize(easy_vals)
     h = summarize(hard_vals)
     gap = round(h["mean"] - e["mean"], 2) if e and h else "N/A"
@@ -152,37 +204,41 @@ def print_comparison(metric_name: str, easy_vals: list[float], hard_vals: list[f
     print(f"  Gap (Hard − Easy): {gap}")
 
 
-def cohen_d(a: list[float], b: list[float]) -> str:
-    """Effect size: how well this metric separates the two tiers."""
+def effect_size(a: np.ndarray, b: np.ndarray) -> float | None:
+    """Cohen's d of b relative to a, or None if it is undefined."""
     if len(a) < 2 or len(b) < 2:
-        return "N/A"
-    ma, mb = statistics.mean(a), statistics.mean(b)
-    va, vb = statistics.variance(a), statistics.variance(b)
+        return None
+    ma, mb = a.mean(dtype=np.float64), b.mean(dtype=np.float64)
+    va, vb = a.var(ddof=1, dtype=np.float64), b.var(ddof=1, dtype=np.float64)
     pooled_sd = math.sqrt((va + vb) / 2)
     if pooled_sd == 0:
-        return "N/A"
-    d = (mb - ma) / pooled_sd
-    return f"{d:+.2f}"
+        return None
+    return float((mb - ma) / pooled_sd)
+
+
+def cohen_d(a: np.ndarray, b: np.ndarray) -> str:
+    """Effect size: how well this metric separates the two tiers."""
+    d = effect_size(a, b)
+    return "N/A" if d is None else f"{d:+.2f}"
 
 
 # ---------------------------------------------------------------------------
 # Histogram (terminal-friendly)
 # ---------------------------------------------------------------------------
 
-def print_histogram(label: str, easy_vals: list[float], hard_vals: list[float],
+def print_histogram(label: str, easy_vals: np.ndarray, hard_vals: np.ndarray,
                     bin_min: float, bin_max: float, n_bins: int = 20):
     """Print overlapping ASCII histogram for two distributions."""
     bin_width = (bin_max - bin_min) / n_bins
 
     def bin_counts(vals):
-        counts = [0] * n_bins
-        for v in vals:
-            idx = int((v - bin_min) / bin_width)
-            idx = max(0, min(n_bins - 1, idx))
-            counts[idx] += 1
+        if len(vals) == 0:
+            return np.zeros(n_bins)
+        # Out-of-range values land in the first/last bin
+        clipped = np.clip(vals, bin_min, bin_max)
+        counts, _ = np.histogram(clipped, bins=n_bins, range=(bin_min, bin_max))
         # Normalize to fractions
-        total = len(vals) if vals else 1
-        return [c / total for c in counts]
+        return counts / len(vals)
 
     e_counts = bin_counts(easy_vals)
     h_counts = bin_counts(hard_vals)
@@ -208,13 +264,25 @@ def print_histogram(label: str, easy_vals: list[float], hard_vals: list[float],
 # Main
 # ---------------------------------------------------------------------------
 
+def build_zipf_table(texts) -> dict[str, float]:
+    """Look up every distinct token across `texts` in wordfreq exactly once."""
+    vocab = set()
+    for text in texts:
+        vocab.update(_WORD_RE.findall(text.lower()))
+    return {w: zipf_frequency(w, "en") for w in vocab}
+
+
+def _init_worker(zipf_table: dict[str, float]):
+    """Seed a worker's Zipf cache with the prefetched vocabulary table."""
+    _ZIPF_CACHE.update(zipf_table)
+
+
 def load_corpus(path: Path) -> list[dict]:
     articles = []
-    with open(path) as f:
+    with open(path, "rb") as f:
         for line in f:
-            line = line.strip()
-            if line:
-                articles.append(json.loads(line))
+            if line.strip():
+                articles.append(json_loads(line))
     return articles
 
 
@@ -245,16 +313,30 @@ def main():
 
     print("\nAnalyzing articles (this may take a moment for wordfreq lookups)...")
 
-    metrics = defaultdict(lambda: {"easy": [], "hard": []})
-
-    for tier_name, articles in [("easy", easy_articles), ("hard", hard_sample)]:
-        for art in articles:
-            result = analyze_article(art["text"])
-            if result is None:
-                continue
-            for key in ["fk_grade", "dale_chall", "mean_zipf", "pct_rare",
-                        "ttr", "pct_poly", "mean_word_len"]:
-                metrics[key][tier_name].append(result[key])
+    zipf_table = build_zipf_table(
+        art["text"] for art in itertools.chain(easy_articles, hard_sample)
+    )
+    print(f"  Vocabulary: {len(zipf_table):,} distinct words")
+
+    # One packed float32 row per article; articles with no words are dropped
+    tier_mats = {}
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(zipf_table,)) as ex:
+        for tier_name, articles in [("easy", easy_articles), ("hard", hard_sample)]:
+            mat = np.empty((len(articles), len(METRIC_KEYS)), dtype=np.float32)
+            n = 0
+            texts = (art["text"] for art in articles)
+            for row in ex.map(analyze_article, texts, chunksize=64):
+                if row is None:
+                    continue
+                mat[n] = row
+                n += 1
+            tier_mats[tier_name] = mat[:n]
+
+    # Per-metric column views for the comparisons and histograms below
+    metrics = {
+        key: {tier: mat[:, j] for tier, mat in tier_mats.items()}
+        for j, key in enumerate(METRIC_KEYS)
+    }
 
     # Print comparisons
     metric_labels = {
@@ -297,21 +379,22 @@ def main():
         print(f"{s:>8s}", end="")
     print()
 
-    for i, ki in enumerate(keys):
+    # Pearson correlations for every metric pair in one call; a metric with
+    # zero variance correlates as 0 rather than NaN.
+    hard_mat = tier_mats["hard"][:, [METRIC_KEYS.index(k) for k in keys]].astype(np.float64)
+    if len(hard_mat) >= 2:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = np.nan_to_num(np.corrcoef(hard_mat, rowvar=False))
+    else:
+        corr = None
+
+    for i in range(len(keys)):
         print(f"  {short[i]:8s}", end="")
-        vi = metrics[ki]["hard"]
-        for j, kj in enumerate(keys):
-            vj = metrics[kj]["hard"]
-            if len(vi) != len(vj) or len(vi) < 2:
+        for j in range(len(keys)):
+            if corr is None:
                 print(f"{'N/A':>8s}", end="")
-                continue
-            # Pearson correlation
-            mi, mj = statistics.mean(vi), statistics.mean(vj)
-            cov = sum((a - mi) * (b - mj) for a, b in zip(vi, vj)) / (len(vi) - 1)
-            si = statistics.stdev(vi)
-            sj = statistics.stdev(vj)
-            r = cov / (si * sj) if si > 0 and sj > 0 else 0
-            print(f"{r:8.2f}", end="")
+            else:
+                print(f"{corr[i, j]:8.2f}", end="")
         print()
 
     # Summary recommendation
@@ -322,11 +405,8 @@ def main():
     for key, label in metric_labels.items():
         e, h = metrics[key]["easy"], metrics[key]["hard"]
         if len(e) >= 2 and len(h) >= 2:
-            ma, mb = statistics.mean(e), statistics.mean(h)
-            va, vb = statistics.variance(e), statistics.variance(h)
-            pooled = math.sqrt((va + vb) / 2)
-            d = abs((mb - ma) / pooled) if pooled > 0 else 0
-            rankings.append((d, key, label))
+            d = effect_size(e, h)
+            rankings.append((abs(d) if d is not None else 0, key, label))
     rankings.sort(reverse=True)
     print()
     for d, key, label in rankings:
@@ -4,17 +4,33 @@ Generate corpus-medium.jsonl by filtering the bottom 20% of Hard articles
 by a weighted composite of Dale-Chall (0.50), FK Grade (0.25), and
 %Polysyllabic (0.25), z-normalized against the Hard corpus.
 
+Scores are cached in .medium-scores.npz next to the corpus and reused while
+corpus-hard.jsonl is unchanged, so re-runs (e.g. to try other weights) skip
+straight to ranking. Delete the file to force a rescore.
+
 Usage:
     uv run generate_medium.py
+    uv run --with numba generate_medium.py   # JIT syllable counting
 """
 
-import json
+import itertools
 import re
-import statistics
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from wordfreq import zipf_frequency
+import numpy as np
+from wordfreq import iter_wordlist, zipf_frequency
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson not installed: stdlib parser
+    from json import loads as json_loads
+
+try:
+    from numba_kernels import syllable_stats
+except ImportError:  # numba not installed: use the cached pure-Python path
+    syllable_stats = None
 
 # ---------------------------------------------------------------------------
 # Composite weights and cutoff
@@ -23,125 +39,267 @@ W_DC = 0.50
 W_FK = 0.25
 W_POLY = 0.25
 PERCENTILE_CUTOFF = 20  # bottom 20% of Hard
+SCORE_BATCH = 5000      # articles in flight per scoring batch
+SCORE_CACHE_VERSION = 1  # bump whenever score_article's output changes
 
 # ---------------------------------------------------------------------------
-_VOWELS = set("aeiouyAEIOUY")
-_WORD_RE = re.compile(r"[a-zA-Z']+")
+# 256-entry byte -> is-vowel table, indexed by the bytes of a word
+_VOWEL_TABLE = bytes(1 if chr(i) in "aeiouyAEIOUY" else 0 for i in range(256))
+# 256-entry byte -> byte table that blanks every non-word byte. Tokens are
+# maximal runs of ASCII letters and apostrophes (UTF-8 multibyte sequences
+# never qualify), so translate + split tokenizes in two C passes with no
+# regex engine in the loop.
+_TOKEN_TABLE = bytes(
+    b if chr(b) in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'" else 0x20
+    for b in range(256)
+)
+_SENT_RE = re.compile(r"[.!?]+")
+
+
+class _SyllableCache(dict):
+    """token -> syllable count, computed on first lookup.
+
+    __missing__ lets map(_SYL_CACHE.__getitem__, tokens) feed np.fromiter
+    directly: hits stay in C and only new tokens call count_syllables.
+    """
+
+    def __missing__(self, word: str) -> int:
+        n = self[word] = count_syllables(word)
+        return n
+
+
+# Per-token memo tables. Natural-language text reuses a small vocabulary
+# heavily, so each unique token pays for syllable counting and the wordfreq
+# lookup only once per run.
+_SYL_CACHE: dict[str, int] = _SyllableCache()
+_ZIPF_CACHE: dict[str, float] = {}
+
+
+def familiar_words(min_zipf: float = 4.0) -> frozenset[str]:
+    """Every wordfreq English word with Zipf >= min_zipf.
+
+    The wordlist is ordered by frequency, so the scan stops at the first
+    word below the threshold (~7k words for 4.0).
+    """
+    words = []
+    for w in iter_wordlist("en"):
+        if zipf_frequency(w, "en") < min_zipf:
+            break
+        words.append(w)
+    return frozenset(words)
+
+
+# Dale-Chall "familiar" threshold: Zipf >= 4.0
+FAMILIAR_WORDS = familiar_words(4.0)
 
 
 def count_syllables(word: str) -> int:
-    word = word.strip(".,;:!?\"'()[]")
-    if not word:
-        return 1
+    """Syllables in a tokenize() token (ASCII letters and apostrophes only).
+
+    Tokens need no punctuation stripping: apostrophes are never vowels, so
+    they only matter for the trailing silent-e check.
+    """
+    # Count vowel-group onsets: a vowel byte whose predecessor is not a vowel
     count = 0
-    prev_vowel = False
-    for ch in word:
-        is_vowel = ch in _VOWELS
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
-    if word.endswith("e") and count > 1:
+    prev = 0
+    for b in word.encode("ascii"):
+        v = _VOWEL_TABLE[b]
+        count += v & ~prev
+        prev = v
+    if count > 1 and word.rstrip("'").endswith("e"):
         count -= 1
     return max(1, count)
 
 
+def tokenize(low: str) -> list[str]:
+    """Runs of [a-zA-Z'] in low, in order (same tokens as re.findall)."""
+    buf = low.encode("utf-8", "surrogatepass").translate(_TOKEN_TABLE)
+    return buf.decode("ascii").split()
+
+
 def score_article(text: str) -> dict | None:
-    raw_words = text.split()
-    n_words = len(raw_words)
+    # One tokenization pass; alphabetic tokens feed FK, Dale-Chall and %Poly
+    low = text.lower()
+    alpha_words = tokenize(low)
+    n_words = len(alpha_words)
     if n_words == 0:
         return None
 
-    n_sents = max(1, len(re.findall(r"[.!?]+", text)))
-    alpha_words = _WORD_RE.findall(text.lower())
-    n_alpha = len(alpha_words)
-    if n_alpha == 0:
-        return None
+    n_sents = max(1, sum(1 for _ in _SENT_RE.finditer(low)))
+
+    # Familiarity is a set lookup. Tokens carrying apostrophes are
+    # re-tokenized by wordfreq ("doctors'" scores as "doctors"), so those few
+    # fall back to a cached zipf_frequency call.
+    familiar = FAMILIAR_WORDS
+    zipf_cache = _ZIPF_CACHE
+    n_unfamiliar = 0
+    for w in alpha_words:
+        if w in familiar:
+            continue
+        if "'" in w:
+            z = zipf_cache.get(w)
+            if z is None:
+                z = zipf_cache[w] = zipf_frequency(w, "en")
+            if z >= 4.0:
+                continue
+        n_unfamiliar += 1
+
+    if syllable_stats is not None:
+        _, n_syllables, n_poly = syllable_stats(low)
+    else:
+        syl_arr = np.fromiter(map(_SYL_CACHE.__getitem__, alpha_words),
+                              dtype=np.int16, count=n_words)
+        n_syllables = int(syl_arr.sum())
+        n_poly = int(np.count_nonzero(syl_arr >= 3))
 
     # FK Grade
-    n_syllables = sum(count_syllables(w) for w in raw_words)
     fk = 0.39 * (n_words / n_sents) + 11.8 * (n_syllables / n_words) - 15.59
 
     # Dale-Chall (Zipf-based familiar threshold)
-    zipf_scores = [zipf_frequency(w, "en") for w in alpha_words]
-    n_unfamiliar = sum(1 for z in zipf_scores if z < 4.0)
-    pct_unfamiliar = (n_unfamiliar / n_alpha) * 100
+    pct_unfamiliar = (n_unfamiliar / n_words) * 100
     dc = 0.1579 * pct_unfamiliar + 0.0496 * (n_words / n_sents)
     if pct_unfamiliar > 5:
         dc += 3.6365
 
     # % Polysyllabic
-    n_poly = sum(1 for w in alpha_words if count_syllables(w) >= 3)
-    pct_poly = n_poly / n_alpha
+    pct_poly = n_poly / n_words
 
     return {"fk": fk, "dc": dc, "pct_poly": pct_poly}
 
 
+def score_line(line: bytes) -> dict | None:
+    """score_article for one raw JSONL record.
+
+    Runs in the pool worker, so the parent process never decodes records:
+    it only splits lines and tracks offsets.
+    """
+    return score_article(json_loads(line)["text"])
+
+
+def iter_lines(path: Path):
+    """Yield (byte offset, raw line) for each non-blank JSONL line."""
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield offset, line
+            offset += len(line)
+
+
+def score_corpus(hard_path: Path) -> tuple[list[tuple[int, dict]], int]:
+    """Score every article; returns ([(byte offset, scores)], n_articles)."""
+    scored = []
+    n_articles = 0
+    with ProcessPoolExecutor() as ex:
+        records = iter_lines(hard_path)
+        while batch := list(itertools.islice(records, SCORE_BATCH)):
+            offsets, lines = zip(*batch)
+            for offset, s in zip(offsets, ex.map(score_line, lines, chunksize=256)):
+                if s:
+                    scored.append((offset, s))
+            n_articles += len(batch)
+            print(f"  {n_articles:,} articles")
+    return scored, n_articles
+
+
+def _corpus_stamp(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def load_score_cache(cache_path: Path, hard_path: Path):
+    """Cached (scored, n_articles) from a previous run, or None if stale."""
+    if not cache_path.exists():
+        return None
+    mtime_ns, size = _corpus_stamp(hard_path)
+    with np.load(cache_path) as data:
+        if (int(data["version"]) != SCORE_CACHE_VERSION
+                or int(data["mtime_ns"]) != mtime_ns or int(data["size"]) != size):
+            return None
+        rows = zip(data["offsets"].tolist(), data["fk"].tolist(),
+                   data["dc"].tolist(), data["pct_poly"].tolist())
+        scored = [(offset, {"fk": fk, "dc": dc, "pct_poly": poly})
+                  for offset, fk, dc, poly in rows]
+        return scored, int(data["n_articles"])
+
+
+def save_score_cache(cache_path: Path, hard_path: Path,
+                     scored: list[tuple[int, dict]], n_articles: int):
+    mtime_ns, size = _corpus_stamp(hard_path)
+    np.savez_compressed(
+        cache_path,
+        version=SCORE_CACHE_VERSION,
+        mtime_ns=mtime_ns,
+        size=size,
+        n_articles=n_articles,
+        offsets=np.array([o for o, _ in scored], dtype=np.int64),
+        fk=np.array([s["fk"] for _, s in scored], dtype=np.float64),
+        dc=np.array([s["dc"] for _, s in scored], dtype=np.float64),
+        pct_poly=np.array([s["pct_poly"] for _, s in scored], dtype=np.float64),
+    )
+
+
 def main():
     script_dir = Path(__file__).parent
     hard_path = script_dir / "corpus-hard.jsonl"
     out_path = script_dir / "corpus-medium.jsonl"
+    cache_path = script_dir / ".medium-scores.npz"
 
-    print("Loading Hard corpus...")
-    hard_articles = []
-    with open(hard_path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                hard_articles.append(json.loads(line))
-    print(f"  {len(hard_articles):,} articles")
-
-    print(f"\nScoring all articles...")
-    scored = []  # (index, scores)
-    for i, art in enumerate(hard_articles):
-        if (i + 1) % 5000 == 0:
-            print(f"  {i + 1:,} / {len(hard_articles):,}")
-        s = score_article(art["text"])
-        if s:
-            scored.append((i, s))
-    print(f"  Scored: {len(scored):,}")
-
-    # Z-normalize against Hard corpus
-    fk_vals = [s["fk"] for _, s in scored]
-    dc_vals = [s["dc"] for _, s in scored]
-    poly_vals = [s["pct_poly"] for _, s in scored]
-
-    fk_mean, fk_std = statistics.mean(fk_vals), statistics.stdev(fk_vals)
-    dc_mean, dc_std = statistics.mean(dc_vals), statistics.stdev(dc_vals)
-    poly_mean, poly_std = statistics.mean(poly_vals), statistics.stdev(poly_vals)
-
-    def composite(s: dict) -> float:
-        z_fk = (s["fk"] - fk_mean) / fk_std
-        z_dc = (s["dc"] - dc_mean) / dc_std
-        z_poly = (s["pct_poly"] - poly_mean) / poly_std
-        return W_DC * z_dc + W_FK * z_fk + W_POLY * z_poly
-
-    ranked = [(i, composite(s)) for i, s in scored]
-    ranked.sort(key=lambda x: x[1])
-
-    n_medium = int(len(ranked) * PERCENTILE_CUTOFF / 100)
-    selected_indices = set(i for i, _ in ranked[:n_medium])
+    # The Hard corpus is streamed rather than loaded: one scoring pass that
+    # keeps only byte offsets and scores, then a seek-and-copy of the
+    # selected lines.
+    cached = load_score_cache(cache_path, hard_path)
+    if cached is not None:
+        scored, n_articles = cached
+        print(f"Loaded cached scores from {cache_path.name}")
+    else:
+        print(f"Scoring all articles...")
+        scored, n_articles = score_corpus(hard_path)
+        save_score_cache(cache_path, hard_path, scored, n_articles)
+    print(f"  Scored: {len(scored):,} / {n_articles:,}")
+
+    # Z-normalize against Hard corpus and combine, as whole-array ops
+    n_scored = len(scored)
+    offsets = np.fromiter((o for o, _ in scored), dtype=np.int64, count=n_scored)
+    fk, dc, poly = (
+        np.fromiter((s[key] for _, s in scored), dtype=np.float64, count=n_scored)
+        for key in ("fk", "dc", "pct_poly")
+    )
+
+    def zscore(a: np.ndarray) -> np.ndarray:
+        return (a - a.mean()) / a.std(ddof=1)
+
+    comp = W_DC * zscore(dc) + W_FK * zscore(fk) + W_POLY * zscore(poly)
+
+    # Bottom-k by composite in O(n); order within the selection is irrelevant
+    # since lines are written back in corpus order.
+    n_medium = int(n_scored * PERCENTILE_CUTOFF / 100)
+    if n_medium:
+        bottom = np.argpartition(comp, n_medium - 1)[:n_medium]
+    else:
+        bottom = np.empty(0, dtype=np.intp)
+    selected_offsets = np.sort(offsets[bottom]).tolist()
 
     print(f"\n  Cutoff: bottom {PERCENTILE_CUTOFF}% → {n_medium:,} articles")
 
-    # Write output
+    # Write output: copy the selected lines verbatim, in corpus order
     written = 0
-    with open(out_path, "w") as f:
-        for i, art in enumerate(hard_articles):
-            if i in selected_indices:
-                f.write(json.dumps(art, ensure_ascii=False) + "\n")
-                written += 1
+    with open(hard_path, "rb") as src, open(out_path, "wb") as f:
+        for offset in selected_offsets:
+            src.seek(offset)
+            line = src.readline()
+            f.write(line if line.endswith(b"\n") else line + b"\n")
+            written += 1
 
     print(f"  Wrote {written:,} articles to {out_path.name}")
 
     # Quick profile
-    medium_fk = [scored_s["fk"] for idx, scored_s in scored if idx in selected_indices]
-    medium_dc = [scored_s["dc"] for idx, scored_s in scored if idx in selected_indices]
-    medium_poly = [scored_s["pct_poly"] for idx, scored_s in scored if idx in selected_indices]
+    medium_fk, medium_dc, medium_poly = fk[bottom], dc[bottom], poly[bottom]
 
     print(f"\n  Medium tier profile:")
-    print(f"    FK Grade:    mean={statistics.mean(medium_fk):.2f}  median={statistics.median(medium_fk):.2f}")
-    print(f"    Dale-Chall:  mean={statistics.mean(medium_dc):.2f}  median={statistics.median(medium_dc):.2f}")
-    print(f"    %Polysyllab: mean={statistics.mean(medium_poly):.1%}  median={statistics.median(medium_poly):.1%}")
+    print(f"    FK Grade:    mean={medium_fk.mean():.2f}  median={np.median(medium_fk):.2f}")
+    print(f"    Dale-Chall:  mean={medium_dc.mean():.2f}  median={np.median(medium_dc):.2f}")
+    print(f"    %Polysyllab: mean={medium_poly.mean():.1%}  median={np.median(medium_poly):.1%}")
 
 
 if __name__ == "__main__":
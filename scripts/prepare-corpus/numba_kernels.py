@@ -0,0 +1,79 @@
+"""
+Numba-compiled text kernels for the readability scripts.
+
+numba is optional: analyze_readability.py and generate_medium.py import this
+module inside a try/except and fall back to their cached pure-Python paths
+when it is missing. To enable the kernels:
+
+    uv run --with numba analyze_readability.py
+"""
+
+import numpy as np
+from numba import njit
+
+# Byte classes over the UTF-8 encoding of lowercased text, mirroring
+# _WORD_RE ([a-zA-Z']+): 0 = not part of a word, 1 = apostrophe,
+# 2 = consonant letter, 3 = vowel letter. Bytes >= 0x80 are never word bytes.
+_BYTE_CLASS = np.zeros(256, dtype=np.uint8)
+_BYTE_CLASS[ord("'")] = 1
+for _ch in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ":
+    _BYTE_CLASS[ord(_ch)] = 2
+for _ch in "aeiouyAEIOUY":
+    _BYTE_CLASS[ord(_ch)] = 3
+del _ch
+
+_E = ord("e")
+
+
+@njit(cache=True, boundscheck=False)
+def _syllable_stats(buf):
+    """Return (n_words, n_syllables, n_poly) for a buffer of text bytes.
+
+    Words are maximal runs of [a-zA-Z'] bytes. Each word's syllables follow
+    count_syllables: vowel-group onsets, minus a trailing silent e (looking
+    past trailing apostrophes), at least one.
+    """
+    n_words = 0
+    n_syllables = 0
+    n_poly = 0
+    in_word = False
+    count = 0
+    prev_vowel = False
+    last_letter = 0
+    n = buf.shape[0]
+    for i in range(n + 1):
+        cls = _BYTE_CLASS[buf[i]] if i < n else 0
+        if cls != 0:
+            in_word = True
+            if cls >= 2:
+                last_letter = buf[i]
+            is_vowel = cls == 3
+            if is_vowel and not prev_vowel:
+                count += 1
+            prev_vowel = is_vowel
+        elif in_word:
+            if last_letter == _E and count > 1:
+                count -= 1
+            if count < 1:
+                count = 1
+            n_words += 1
+            n_syllables += count
+            if count >= 3:
+                n_poly += 1
+            in_word = False
+            count = 0
+            prev_vowel = False
+            last_letter = 0
+    return n_words, n_syllables, n_poly
+
+
+def syllable_stats(low: str) -> tuple[int, int, int]:
+    """Word, syllable and polysyllable counts for lowercased article text."""
+    buf = np.frombuffer(low.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+    n_words, n_syllables, n_poly = _syllable_stats(buf)
+    return int(n_words), int(n_syllables), int(n_poly)
+
+
+# Compile (or load the on-disk cache) at import so the first article isn't
+# charged for it.
+syllable_stats("warm up")
@@ -11,7 +11,6 @@ Supports tiered difficulty:
 
 Usage:
     pip install -r requirements.txt
-    python -m spacy download en_core_web_sm
 
     # Easy tier from Simple English Wikipedia
     python prepare_corpus.py --wiki simple --tier easy
@@ -23,22 +22,32 @@ Usage:
     python prepare_corpus.py --tier hard
 
 The script caches raw API responses, so it can be interrupted and resumed
-without re-fetching already-downloaded data.
+without re-fetching already-downloaded data. Pass --revalidate to re-fetch
+only the cached articles whose pages have been edited since.
 """
 
 import argparse
 import json
+import os
 import re
-import statistics
-import sys
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import requests
-import spacy
+import ahocorasick
+import httpx
+import numpy as np
 from tqdm import tqdm
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # orjson not installed: stdlib serializer
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -51,8 +60,11 @@ USER_AGENT = (
     "(speed reading training app; https://github.com/cmfunderburk/Reader)"
 )
 BATCH_SIZE = 20          # max titles per MediaWiki query request
-REQUEST_DELAY = 0.25     # seconds between API requests
+REV_BATCH_SIZE = 50      # max titles per revisions-only query request
+REQUEST_DELAY = 0.25     # seconds between API requests (per fetch worker)
+FETCH_WORKERS = 4        # concurrent extract requests
 CM_PAGE_SIZE = 500       # categorymembers page size (max 500)
+HTTP_TIMEOUT = 30.0      # seconds per API request
 
 EN_CATEGORIES = [
     "Category:Good articles",
@@ -121,7 +133,7 @@ DOMAIN_KEYWORDS: dict[str, list[str]] = {
 # ---------------------------------------------------------------------------
 
 def fetch_category_members(
-    category: str, session: requests.Session, api_url: str = WIKI_API
+    category: str, session: httpx.Client, api_url: str = WIKI_API
 ) -> list[str]:
     """Fetch all article titles in a Wikipedia category (non-recursive)."""
     titles = []
@@ -153,17 +165,18 @@ def fetch_category_members(
 
 
 def fetch_extracts_batch(
-    titles: list[str], session: requests.Session, api_url: str = WIKI_API
+    titles: list[str], session: httpx.Client, api_url: str = WIKI_API
 ) -> dict[str, dict]:
-    """Fetch lead sections and categories for a batch of up to 20 titles."""
+    """Fetch lead sections, categories and current revision for up to 20 titles."""
     params = {
         "action": "query",
         "titles": "|".join(titles),
-        "prop": "extracts|categories",
+        "prop": "extracts|categories|revisions",
         "exintro": True,
         "explaintext": True,
         "clshow": "!hidden",
         "cllimit": "max",
+        "rvprop": "ids|timestamp",
         "format": "json",
     }
 
@@ -183,66 +196,100 @@ def fetch_extracts_batch(
         ]
         if extract:
             results[title] = {"extract": extract, "categories": categories}
+            if page.get("revisions"):
+                rev = page["revisions"][0]
+                results[title]["rev_id"] = rev["revid"]
+                results[title]["rev_ts"] = rev["timestamp"]
 
     return results
 
 
+def fetch_revisions_batch(
+    titles: list[str], session: httpx.Client, api_url: str = WIKI_API
+) -> dict[str, int]:
+    """Fetch the current revision id for a batch of up to 50 titles."""
+    params = {
+        "action": "query",
+        "titles": "|".join(titles),
+        "prop": "revisions",
+        "rvprop": "ids",
+        "format": "json",
+    }
+
+    resp = session.get(api_url, params=params)
+    resp.raise_for_status()
+    data = resp.json()
+
+    revisions = {}
+    for page_id, page in data.get("query", {}).get("pages", {}).items():
+        if int(page_id) < 0:       # missing / invalid page
+            continue
+        if page.get("revisions"):
+            revisions[page["title"]] = page["revisions"][0]["revid"]
+
+    return revisions
+
+
 # ---------------------------------------------------------------------------
 # Text cleaning
 # ---------------------------------------------------------------------------
 
-def clean_citations(text: str) -> str:
-    """Remove [1], [note 2], [a], [citation needed], etc."""
-    text = re.sub(r"\[\d+\]", "", text)
-    text = re.sub(r"\[note \d+\]", "", text)
-    text = re.sub(r"\[[a-z]\]", "", text)
-    text = re.sub(r"\[citation needed\]", "", text, flags=re.IGNORECASE)
-    return text
+# Every citation form in one pass; only "citation needed" ignores case
+_CITATION_RE = re.compile(r"\[(?:\d+|note \d+|[a-z]|(?i:citation needed))\]")
+_FIRST_SENT_RE = re.compile(r"^(.*?[.!?])\s+(?=[A-Z])", re.DOTALL)
+_MULTI_SPACE_RE = re.compile(r"  +")
+_BOLD_ITALIC_RE = re.compile(r"'{2,3}")
 
 
-# Patterns inside parentheticals that signal strippable content
-_STRIP_PAREN_PATTERNS = [
-    re.compile(r"/[^/]+/"),                         # IPA transcriptions
-    re.compile(r"[ˈˌːʃʒθðŋɪʊɛɔɑəæɒʌɜɐ]"),         # IPA characters
-    re.compile(r"\balso known as\b", re.I),
-    re.compile(r"\babbreviated?\b", re.I),
-    re.compile(r"\bformerly\b", re.I),
-    re.compile(r"\bor simply\b", re.I),
-    re.compile(r"\blit\.\s", re.I),
-    re.compile(
-        r"\bfrom (?:Latin|Greek|French|German|Spanish|Italian|Arabic|"
-        r"Japanese|Chinese|Sanskrit|Old English|Middle English|Proto)",
-        re.I,
-    ),
-    re.compile(
-        r"(?:Latin|Greek|French|German|Spanish|Italian|Arabic|"
-        r"Japanese|Chinese|Hindi|Russian|Portuguese|Korean|Turkish):\s",
-    ),
-]
+def clean_citations(text: str) -> str:
+    """Remove [1], [note 2], [a], [citation needed], etc."""
+    return _CITATION_RE.sub("", text)
+
+
+# Patterns inside parentheticals that signal strippable content, fused into
+# one alternation so each parenthetical costs a single search. The
+# "Language: " label stays case-sensitive; the phrase cues are not.
+_STRIP_PAREN_RE = re.compile(
+    r"/[^/]+/"                                      # IPA transcriptions
+    r"|[ˈˌːʃʒθðŋɪʊɛɔɑəæɒʌɜɐ]"                      # IPA characters
+    r"|(?i:\balso known as\b"
+    r"|\babbreviated?\b"
+    r"|\bformerly\b"
+    r"|\bor simply\b"
+    r"|\blit\.\s"
+    r"|\bfrom (?:Latin|Greek|French|German|Spanish|Italian|Arabic|"
+    r"Japanese|Chinese|Sanskrit|Old English|Middle English|Proto))"
+    r"|(?:Latin|Greek|French|German|Spanish|Italian|Arabic|"
+    r"Japanese|Chinese|Hindi|Russian|Portuguese|Korean|Turkish):\s"
+)
 
 
 def _should_strip_paren(content: str) -> bool:
     """Decide whether a parenthetical's content warrants removal."""
-    for pat in _STRIP_PAREN_PATTERNS:
-        if pat.search(content):
-            return True
+    if _STRIP_PAREN_RE.search(content):
+        return True
     # Long parentheticals (>10 words) are likely disambiguation, not content
     if len(content.split()) > 10:
         return True
     return False
 
 
+_PAREN_POS_RE = re.compile(r"[()]")
+
+
 def _find_top_level_parens(text: str) -> list[tuple[int, int, str]]:
     """Find top-level parenthetical groups, handling nesting."""
     groups = []
     depth = 0
     start = -1
-    for i, ch in enumerate(text):
-        if ch == "(":
+    # Visit only the parentheses themselves, not every character
+    for m in _PAREN_POS_RE.finditer(text):
+        i = m.start()
+        if m.group() == "(":
             if depth == 0:
                 start = i
             depth += 1
-        elif ch == ")":
+        else:
             depth -= 1
             if depth == 0 and start >= 0:
                 groups.append((start, i + 1, text[start + 1 : i]))
@@ -254,7 +301,7 @@ def clean_first_sentence_parentheticals(text: str) -> str:
     """Strip IPA / etymology / alias parentheticals from the first sentence."""
     # Isolate the first sentence (up to first sentence-ending punctuation
     # followed by whitespace and a capital letter, or end of string).
-    m = re.match(r"^(.*?[.!?])\s+(?=[A-Z])", text, re.DOTALL)
+    m = _FIRST_SENT_RE.match(text)
     if m:
         first_sent = m.group(1)
         rest = text[m.end() - 1:]   # keep the space before the capital
@@ -270,7 +317,7 @@ def clean_first_sentence_parentheticals(text: str) -> str:
             before = first_sent[:start].rstrip()
             after = first_sent[end:].lstrip()
             first_sent = before + " " + after
-            first_sent = re.sub(r"  +", " ", first_sent)
+            first_sent = _MULTI_SPACE_RE.sub(" ", first_sent)
 
     return (first_sent + rest).strip()
 
@@ -279,8 +326,9 @@ def clean_text(text: str) -> str:
     """Full cleaning pipeline for a lead section."""
     text = clean_citations(text)
     text = clean_first_sentence_parentheticals(text)
-    text = re.sub(r"\s+", " ", text).strip()     # normalize whitespace
-    text = re.sub(r"'{2,3}", "", text)            # residual bold/italic
+    text = " ".join(text.split())                 # normalize whitespace
+    if "''" in text:
+        text = _BOLD_ITALIC_RE.sub("", text)      # residual bold/italic
     return text
 
 
@@ -290,25 +338,32 @@ def clean_text(text: str) -> str:
 # Flesch-Kincaid readability
 # ---------------------------------------------------------------------------
 
-_VOWELS = set("aeiouyAEIOUY")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouyAEIOUY]+")
+_SENT_RE = re.compile(r"[.!?]+")
 
 
 def count_syllables(word: str) -> int:
     """Estimate syllable count using vowel-group heuristic."""
-    word = word.strip(".,;:!?\"'()[]")
-    if not word:
-        return 1
-    count = 0
-    prev_vowel = False
-    for ch in word:
-        is_vowel = ch in _VOWELS
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
+    # Surrounding punctuation is never a vowel, so only the silent-e check
+    # needs it stripped.
+    count = len(_VOWEL_GROUP_RE.findall(word))
     # Subtract silent-e
-    if word.endswith("e") and count > 1:
+    if count > 1 and word.rstrip(".,;:!?\"'()[]").endswith("e"):
         count -= 1
-    return max(1, count)
+    return count or 1
+
+
+class _SyllableCache(dict):
+    """word -> syllable count, computed on first lookup."""
+
+    def __missing__(self, word: str) -> int:
+        n = self[word] = count_syllables(word)
+        return n
+
+
+# Lead-section vocabulary plateaus quickly, so after the first few hundred
+# articles nearly every word is a dict hit.
+_SYL_CACHE: dict[str, int] = _SyllableCache()
 
 
 def flesch_kincaid_grade(text: str) -> float:
@@ -317,23 +372,46 @@ def flesch_kincaid_grade(text: str) -> float:
     n_words = len(words)
     if n_words == 0:
         return 0.0
-    n_sents = max(1, len(re.findall(r"[.!?]+", text)))
-    n_syllables = sum(count_syllables(w) for w in words)
+    n_sents = max(1, len(_SENT_RE.findall(text)))
+    n_syllables = sum(map(_SYL_CACHE.__getitem__, words))
     return 0.39 * (n_words / n_sents) + 11.8 * (n_syllables / n_words) - 15.59
 
 
+# Sentence boundary: terminal punctuation run followed by whitespace or end
+_SENT_BOUNDARY_RE = re.compile(r"[.!?]+(?:\s|$)")
+
+
+def count_sentences(text: str) -> int:
+    """Count sentence-ending punctuation runs followed by whitespace or end."""
+    return len(_SENT_BOUNDARY_RE.findall(text))
+
+
 # ---------------------------------------------------------------------------
 # Domain tagging
 # ---------------------------------------------------------------------------
 
+def _build_domain_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over every domain keyword, valued (domain, kw)."""
+    automaton = ahocorasick.Automaton()
+    for domain, keywords in DOMAIN_KEYWORDS.items():
+        for kw in keywords:
+            automaton.add_word(kw, (domain, kw))
+    automaton.make_automaton()
+    return automaton
+
+
+_DOMAIN_AUTOMATON = _build_domain_automaton()
+
+
 def assign_domain(categories: list[str]) -> str:
     """Map an article's visible categories to a coarse domain label."""
     cat_text = " ".join(categories).lower()
-    scores: dict[str, int] = {}
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in cat_text)
-        if score:
-            scores[domain] = score
+    # One pass finds every keyword occurrence, overlaps included ("world war"
+    # and "war "); a domain scores one point per distinct keyword seen.
+    matched = {value for _, value in _DOMAIN_AUTOMATON.iter(cat_text)}
+    hits = Counter(domain for domain, _ in matched)
+    # Built in DOMAIN_KEYWORDS order so max() breaks ties as before
+    scores = {domain: hits[domain] for domain in DOMAIN_KEYWORDS if hits[domain]}
     return max(scores, key=scores.get) if scores else "Other"
 
 
@@ -342,7 +420,7 @@ def assign_domain(categories: list[str]) -> str:
 # ---------------------------------------------------------------------------
 
 def fetch_titles(
-    session: requests.Session,
+    session: httpx.Client,
     cache_dir: Path,
     api_url: str = WIKI_API,
     categories: list[str] | None = None,
@@ -371,24 +449,116 @@ def fetch_titles(
     return all_titles
 
 
+def _article_lines(results: dict[str, dict]) -> bytes:
+    """Serialize fetched articles as articles.jsonl records."""
+    return b"".join(
+        json_dumps({"title": title, **data}) + b"\n" for title, data in results.items()
+    )
+
+
+def load_article_cache(cache_dir: Path) -> dict[str, dict]:
+    """Load articles.jsonl, converting a legacy articles.json snapshot once."""
+    cache_file = cache_dir / "articles.jsonl"
+    legacy_file = cache_dir / "articles.json"
+    articles: dict[str, dict] = {}
+
+    if cache_file.exists():
+        # Records are appended whole, so only a final line without its
+        # newline (an interrupted write) can be incomplete; drop it.
+        complete = 0
+        with open(cache_file, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    record = json_loads(line)
+                    articles[record.pop("title")] = record
+                complete += len(line)
+        if complete != cache_file.stat().st_size:
+            os.truncate(cache_file, complete)
+    elif legacy_file.exists():
+        articles = json.loads(legacy_file.read_text())
+        cache_file.write_bytes(_article_lines(articles))
+        print(f"Converted {legacy_file} to {cache_file.name}")
+
+    return articles
+
+
+def _fetch_concurrently(fetch_batch, batches: list[list[str]], desc: str):
+    """Yield fetch_batch(batch) for every batch, in completion order.
+
+    Each worker pauses after its request, so at most FETCH_WORKERS requests
+    are in flight and each one keeps the usual spacing. A failed batch is
+    reported and skipped; pending batches are cancelled on an error exit or
+    Ctrl-C rather than drained.
+    """
+    def fetch_paced(batch: list[str]):
+        try:
+            return fetch_batch(batch)
+        finally:
+            time.sleep(REQUEST_DELAY)
+
+    ex = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    try:
+        futures = {ex.submit(fetch_paced, batch): i for i, batch in enumerate(batches)}
+        for future in tqdm(as_completed(futures), total=len(futures), desc=desc):
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"\nError on batch {futures[future]}: {e}")
+                continue
+            yield results
+    finally:
+        ex.shutdown(cancel_futures=True)
+
+
+def find_changed_articles(
+    articles: dict[str, dict],
+    titles: list[str],
+    session: httpx.Client,
+    api_url: str = WIKI_API,
+) -> list[str]:
+    """Cached titles whose page has been edited since its extract was fetched.
+
+    Records cached before rev_id was stored count as changed; titles whose
+    revision check failed or whose page is gone are left as cached.
+    """
+    cached = [t for t in titles if t in articles]
+    batches = [cached[i : i + REV_BATCH_SIZE] for i in range(0, len(cached), REV_BATCH_SIZE)]
+    current: dict[str, int] = {}
+    for revisions in _fetch_concurrently(
+        lambda batch: fetch_revisions_batch(batch, session, api_url),
+        batches, "Checking revisions",
+    ):
+        current.update(revisions)
+    return [t for t in cached if t in current and articles[t].get("rev_id") != current[t]]
+
+
 def fetch_articles(
     titles: list[str],
-    session: requests.Session,
+    session: httpx.Client,
     cache_dir: Path,
     api_url: str = WIKI_API,
+    revalidate: bool = False,
 ) -> dict[str, dict]:
-    """Phase 2: fetch lead extracts + categories for all titles (cached, resumable)."""
-    cache_file = cache_dir / "articles.json"
+    """Phase 2: fetch lead extracts + categories for all titles (cached, resumable).
+
+    With revalidate, cached articles are first checked against their pages'
+    current revision ids and re-fetched only if the page has changed.
+    """
+    cache_file = cache_dir / "articles.jsonl"
 
     # Load any previously cached articles
-    if cache_file.exists():
-        articles = json.loads(cache_file.read_text())
+    articles = load_article_cache(cache_dir)
+    if articles:
         print(f"Loaded {len(articles):,} cached articles from {cache_file}")
-    else:
-        articles = {}
 
     # Figure out what still needs fetching
     remaining = [t for t in titles if t not in articles]
+    if revalidate and articles:
+        changed = find_changed_articles(articles, titles, session, api_url)
+        print(f"{len(changed):,} cached articles changed since they were fetched")
+        remaining.extend(changed)
     if not remaining:
         print("All articles already cached.")
         return articles
@@ -396,32 +566,32 @@ def fetch_articles(
     print(f"Fetching extracts for {len(remaining):,} remaining articles ...")
     batches = [remaining[i : i + BATCH_SIZE] for i in range(0, len(remaining), BATCH_SIZE)]
 
-    save_every = 50  # save cache every N batches
-    for i, batch in enumerate(tqdm(batches, desc="Fetching extracts")):
-        try:
-            results = fetch_extracts_batch(batch, session, api_url)
+    # Results are merged on this thread only. Each completed batch is
+    # appended to the cache, so a checkpoint costs only its own records; a
+    # re-fetched article's new record supersedes its old one on load.
+    with open(cache_file, "ab") as cache:
+        for results in _fetch_concurrently(
+            lambda batch: fetch_extracts_batch(batch, session, api_url),
+            batches, "Fetching extracts",
+        ):
             articles.update(results)
-        except Exception as e:
-            print(f"\nError on batch {i}: {e}")
-            # Save progress and continue
-            cache_file.write_text(json.dumps(articles))
-            continue
-        time.sleep(REQUEST_DELAY)
+            cache.write(_article_lines(results))
+            cache.flush()
 
-        if (i + 1) % save_every == 0:
-            cache_file.write_text(json.dumps(articles))
-
-    # Final save
-    cache_file.write_text(json.dumps(articles))
     print(f"Total articles with extracts: {len(articles):,}")
     return articles
 
 
 def process_articles(
-    articles: dict[str, dict], nlp, fk_max: float | None = None
-) -> tuple[list[dict], Counter]:
-    """Phase 3: clean and filter articles, output one entry per article."""
-    all_articles: list[dict] = []
+    articles: dict[str, dict], output_fh, fk_max: float | None = None
+) -> tuple[list[tuple[float, int, int]], Counter]:
+    """Phase 3: clean and filter articles, writing one JSONL line per article.
+
+    Records are streamed to output_fh (opened in binary mode) as they are
+    produced; only (fk_grade, words, sentences) per written article is kept
+    for print_stats.
+    """
+    output_rows: list[tuple[float, int, int]] = []
     stats = Counter()
 
     for title, data in tqdm(articles.items(), desc="Processing"):
@@ -433,9 +603,7 @@ def process_articles(
             continue
 
         cleaned = clean_text(extract)
-        doc = nlp(cleaned)
-        sentences = list(doc.sents)
-        n_sents = len(sentences)
+        n_sents = count_sentences(cleaned)
         wc = len(cleaned.split())
 
         if n_sents < 3 or wc < 20:
@@ -448,27 +616,31 @@ def process_articles(
             continue
 
         domain = assign_domain(categories)
+        fk_grade = round(fk, 1)
 
-        all_articles.append({
+        output_fh.write(json_dumps({
             "title": title,
             "text": cleaned,
             "domain": domain,
-            "fk_grade": round(fk, 1),
+            "fk_grade": fk_grade,
             "words": wc,
             "sentences": n_sents,
-        })
+        }) + b"\n")
+        output_rows.append((fk_grade, wc, n_sents))
         stats[f"domain:{domain}"] += 1
 
-    return all_articles, stats
+    return output_rows, stats
 
 
-def print_stats(raw_articles: dict, output_articles: list[dict], stats: Counter) -> None:
+def print_stats(
+    raw_articles: dict, output_rows: list[tuple[float, int, int]], stats: Counter
+) -> None:
     """Print corpus statistics."""
     print(f"\n{'=' * 55}")
     print("Corpus Statistics")
     print(f"{'=' * 55}")
     print(f"Articles processed:    {len(raw_articles):>8,}")
-    print(f"Articles output:       {len(output_articles):>8,}")
+    print(f"Articles output:       {len(output_rows):>8,}")
     print(f"Skipped (empty lead):  {stats.get('skipped_empty', 0):>8,}")
     print(f"Skipped (too short):   {stats.get('skipped_short', 0):>8,}")
     if stats.get("skipped_fk", 0) > 0:
@@ -482,27 +654,30 @@ def print_stats(raw_articles: dict, output_articles: list[dict], stats: Counter)
     }
     print("\nDomain distribution:")
     for domain, count in sorted(domain_counts.items(), key=lambda x: -x[1]):
-        pct = 100 * count / len(output_articles) if output_articles else 0
+        pct = 100 * count / len(output_rows) if output_rows else 0
         print(f"  {domain:30s} {count:>6,}  ({pct:5.1f}%)")
 
-    if output_articles:
-        fks = [a["fk_grade"] for a in output_articles]
-        wcs = [a["words"] for a in output_articles]
-        scs = [a["sentences"] for a in output_articles]
+    if output_rows:
+        # Columns: fk_grade, words, sentences
+        rows = np.array(output_rows, dtype=np.float64)
+        means = rows.mean(axis=0)
+        medians = np.median(rows, axis=0)
+        mins = rows.min(axis=0)
+        maxs = rows.max(axis=0)
         print(
-            f"\nFK grade:    mean={statistics.mean(fks):.1f}  "
-            f"median={statistics.median(fks):.1f}  "
-            f"min={min(fks):.1f}  max={max(fks):.1f}"
+            f"\nFK grade:    mean={means[0]:.1f}  "
+            f"median={medians[0]:.1f}  "
+            f"min={mins[0]:.1f}  max={maxs[0]:.1f}"
         )
         print(
-            f"Word count:  mean={statistics.mean(wcs):.1f}  "
-            f"median={statistics.median(wcs):.1f}  "
-            f"min={min(wcs)}  max={max(wcs)}"
+            f"Word count:  mean={means[1]:.1f}  "
+            f"median={medians[1]:.1f}  "
+            f"min={int(mins[1])}  max={int(maxs[1])}"
         )
         print(
-            f"Sentences:   mean={statistics.mean(scs):.1f}  "
-            f"median={statistics.median(scs):.1f}  "
-            f"min={min(scs)}  max={max(scs)}"
+            f"Sentences:   mean={means[2]:.1f}  "
+            f"median={medians[2]:.1f}  "
+            f"min={int(mins[2])}  max={int(maxs[2])}"
         )
 
 
@@ -539,6 +714,12 @@ def main() -> None:
         help="Maximum Flesch-Kincaid grade level (skip chunks above this). "
              "Default: 10.0 for medium tier, None otherwise",
     )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Check cached articles' revision ids and re-fetch any that "
+             "changed since they were cached",
+    )
     args = parser.parse_args()
 
     # Resolve tier
@@ -568,39 +749,29 @@ def main() -> None:
 
     print(f"Tier: {tier}  Wiki: {args.wiki}  FK max: {fk_max}")
 
-    # Load spaCy
-    print("Loading spaCy model ...")
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        print("spaCy model not found. Install it with:")
-        print("  python -m spacy download en_core_web_sm")
-        sys.exit(1)
-    nlp.max_length = 200_000
-
-    session = requests.Session()
-    session.headers["User-Agent"] = USER_AGENT
-
-    # Phase 1: titles
-    titles = fetch_titles(session, cache_dir, api_url, categories)
-
-    # Phase 2: extracts + categories
-    articles = fetch_articles(titles, session, cache_dir, api_url)
-
-    # Phase 3: process
-    print("\nCleaning and filtering articles ...")
-    output_articles, stats = process_articles(articles, nlp, fk_max)
+    # One pooled HTTP/2 client: the fetch workers' requests are multiplexed
+    # over a shared connection instead of each holding its own.
+    with httpx.Client(
+        http2=True, headers={"User-Agent": USER_AGENT}, timeout=HTTP_TIMEOUT
+    ) as session:
+        # Phase 1: titles
+        titles = fetch_titles(session, cache_dir, api_url, categories)
+
+        # Phase 2: extracts + categories
+        articles = fetch_articles(
+            titles, session, cache_dir, api_url, revalidate=args.revalidate
+        )
 
-    # Phase 4: write
-    print(f"\nWriting {len(output_articles):,} articles to {output_path} ...")
-    with open(output_path, "w") as f:
-        for article in output_articles:
-            f.write(json.dumps(article) + "\n")
+    # Phase 3: process, streaming each kept article straight to the output
+    print(f"\nCleaning and filtering articles into {output_path} ...")
+    with open(output_path, "wb") as f:
+        output_rows, stats = process_articles(articles, f, fk_max)
+    print(f"Wrote {len(output_rows):,} articles")
 
     file_size_mb = output_path.stat().st_size / (1024 * 1024)
     print(f"Output file: {output_path}  ({file_size_mb:.1f} MB)")
 
-    print_stats(articles, output_articles, stats)
+    print_stats(articles, output_rows, stats)
 
 
 if __name__ == "__main__":
@@ -10,63 +10,65 @@ Usage:
     uv run score_medium.py
 """
 
+import functools
 import json
 import math
 import re
-import statistics
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 from wordfreq import zipf_frequency
 
 # ---------------------------------------------------------------------------
-_VOWELS = set("aeiouyAEIOUY")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouyAEIOUY]+")
 _WORD_RE = re.compile(r"[a-zA-Z']+")
+_SENT_RE = re.compile(r"[.!?]+")
 
 
+@functools.lru_cache(maxsize=65536)
 def count_syllables(word: str) -> int:
-    word = word.strip(".,;:!?\"'()[]")
-    if not word:
-        return 1
-    count = 0
-    prev_vowel = False
-    for ch in word:
-        is_vowel = ch in _VOWELS
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
-    if word.endswith("e") and count > 1:
+    count = len(_VOWEL_GROUP_RE.findall(word))
+    if count > 1 and word.rstrip(".,;:!?\"'()[]").endswith("e"):
         count -= 1
-    return max(1, count)
+    return count or 1
+
+
+@functools.lru_cache(maxsize=131072)
+def _zipf(word: str) -> float:
+    return zipf_frequency(word, "en")
 
 
 def score_article(text: str) -> dict | None:
-    raw_words = text.split()
-    n_words = len(raw_words)
+    # One tokenization pass; alphabetic tokens feed FK, Dale-Chall and %Poly
+    alpha_words = _WORD_RE.findall(text.lower())
+    n_words = len(alpha_words)
     if n_words == 0:
         return None
 
-    n_sents = max(1, len(re.findall(r"[.!?]+", text)))
-    alpha_words = _WORD_RE.findall(text.lower())
-    n_alpha = len(alpha_words)
-    if n_alpha == 0:
-        return None
+    n_sents = max(1, len(_SENT_RE.findall(text)))
+
+    n_syllables = n_poly = n_unfamiliar = 0
+    for w in alpha_words:
+        syl = count_syllables(w)
+        n_syllables += syl
+        if syl >= 3:
+            n_poly += 1
+        if _zipf(w) < 4.0:
+            n_unfamiliar += 1
 
     # FK Grade
-    n_syllables = sum(count_syllables(w) for w in raw_words)
     fk = 0.39 * (n_words / n_sents) + 11.8 * (n_syllables / n_words) - 15.59
 
     # Dale-Chall (Zipf-based familiar threshold)
-    zipf_scores = [zipf_frequency(w, "en") for w in alpha_words]
-    n_unfamiliar = sum(1 for z in zipf_scores if z < 4.0)
-    pct_unfamiliar = (n_unfamiliar / n_alpha) * 100
+    pct_unfamiliar = (n_unfamiliar / n_words) * 100
     dc = 0.1579 * pct_unfamiliar + 0.0496 * (n_words / n_sents)
     if pct_unfamiliar > 5:
         dc += 3.6365
 
     # % Polysyllabic
-    n_poly = sum(1 for w in alpha_words if count_syllables(w) >= 3)
-    pct_poly = n_poly / n_alpha
+    pct_poly = n_poly / n_words
 
     return {"fk": fk, "dc": dc, "pct_poly": pct_poly}
 
@@ -81,13 +83,13 @@ def load_corpus(path: Path) -> list[dict]:
     return articles
 
 
-def summarize(vals: list[float]) -> dict:
-    s = sorted(vals)
+def summarize(vals: np.ndarray) -> dict:
+    s = np.sort(vals)
     n = len(s)
     return {
-        "mean": statistics.mean(s),
-        "median": statistics.median(s),
-        "stdev": statistics.stdev(s) if n > 1 else 0,
+        "mean": s.mean(),
+        "median": np.median(s),
+        "stdev": s.std(ddof=1) if n > 1 else 0,
         "p10": s[int(n * 0.10)],
         "p25": s[int(n * 0.25)],
         "p75": s[int(n * 0.75)],
@@ -95,12 +97,21 @@ def summarize(vals: list[float]) -> dict:
     }
 
 
+def score_columns(scores: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(fk, dc, pct_poly) as float64 arrays, one entry per scored article."""
+    return tuple(
+        np.fromiter((s[key] for s in scores), dtype=np.float64, count=len(scores))
+        for key in ("fk", "dc", "pct_poly")
+    )
+
+
 # ---------------------------------------------------------------------------
 # Weights
 # ---------------------------------------------------------------------------
 W_DC = 0.50
 W_FK = 0.25
 W_POLY = 0.25
+SCORE_CHUNKSIZE = 200  # articles per worker task
 
 
 def main():
@@ -114,58 +125,59 @@ def main():
     print(f"  Easy: {len(easy_articles):,}")
     print(f"  Hard: {len(hard_articles):,}")
 
-    # Score all Easy articles
-    print("\nScoring Easy articles...")
-    easy_scores = []
-    for art in easy_articles:
-        s = score_article(art["text"])
-        if s:
-            easy_scores.append(s)
-    print(f"  Scored: {len(easy_scores)}")
-
-    # Score all Hard articles
-    print(f"\nScoring all {len(hard_articles):,} Hard articles (this takes ~2 min)...")
-    hard_scored = []  # (index, scores_dict)
-    for i, art in enumerate(hard_articles):
-        if (i + 1) % 5000 == 0:
-            print(f"  {i + 1:,} / {len(hard_articles):,}")
-        s = score_article(art["text"])
-        if s:
-            hard_scored.append((i, s))
-    print(f"  Scored: {len(hard_scored):,}")
+    with ProcessPoolExecutor() as ex:
+        # Score all Easy articles
+        print("\nScoring Easy articles...")
+        easy_texts = [art["text"] for art in easy_articles]
+        easy_scores = [
+            s for s in ex.map(score_article, easy_texts, chunksize=SCORE_CHUNKSIZE) if s
+        ]
+        print(f"  Scored: {len(easy_scores)}")
+
+        # Score all Hard articles
+        print(f"\nScoring all {len(hard_articles):,} Hard articles...")
+        hard_texts = [art["text"] for art in hard_articles]
+        hard_scored = []  # (index, scores_dict)
+        for i, s in enumerate(ex.map(score_article, hard_texts, chunksize=SCORE_CHUNKSIZE)):
+            if (i + 1) % 5000 == 0:
+                print(f"  {i + 1:,} / {len(hard_articles):,}")
+            if s:
+                hard_scored.append((i, s))
+        print(f"  Scored: {len(hard_scored):,}")
 
     # Compute z-normalization parameters from Hard corpus
-    hard_fk = [s["fk"] for _, s in hard_scored]
-    hard_dc = [s["dc"] for _, s in hard_scored]
-    hard_poly = [s["pct_poly"] for _, s in hard_scored]
+    hard_fk, hard_dc, hard_poly = score_columns([s for _, s in hard_scored])
+    easy_fk, easy_dc, easy_poly = score_columns(easy_scores)
 
-    fk_mean, fk_std = statistics.mean(hard_fk), statistics.stdev(hard_fk)
-    dc_mean, dc_std = statistics.mean(hard_dc), statistics.stdev(hard_dc)
-    poly_mean, poly_std = statistics.mean(hard_poly), statistics.stdev(hard_poly)
+    fk_mean, fk_std = hard_fk.mean(), hard_fk.std(ddof=1)
+    dc_mean, dc_std = hard_dc.mean(), hard_dc.std(ddof=1)
+    poly_mean, poly_std = hard_poly.mean(), hard_poly.std(ddof=1)
 
     print(f"\n  Hard corpus stats:")
     print(f"    FK:     mean={fk_mean:.2f}  std={fk_std:.2f}")
     print(f"    D-C:    mean={dc_mean:.2f}  std={dc_std:.2f}")
     print(f"    %Poly:  mean={poly_mean:.4f}  std={poly_std:.4f}")
 
-    # Compute composite for Hard articles
-    def composite(s: dict) -> float:
-        z_fk = (s["fk"] - fk_mean) / fk_std
-        z_dc = (s["dc"] - dc_mean) / dc_std
-        z_poly = (s["pct_poly"] - poly_mean) / poly_std
+    # Composite over whole score arrays
+    def composite(fk: np.ndarray, dc: np.ndarray, poly: np.ndarray) -> np.ndarray:
+        z_fk = (fk - fk_mean) / fk_std
+        z_dc = (dc - dc_mean) / dc_std
+        z_poly = (poly - poly_mean) / poly_std
         return W_DC * z_dc + W_FK * z_fk + W_POLY * z_poly
 
-    hard_composites = [(i, composite(s), s) for i, s in hard_scored]
-    hard_composites.sort(key=lambda x: x[1])
-
-    comp_vals = [c for _, c, _ in hard_composites]
+    # Hard articles in ascending composite order (stable, like list.sort),
+    # so every cutoff below is a prefix slice of these arrays
+    hard_comp = composite(hard_fk, hard_dc, hard_poly)
+    order = np.argsort(hard_comp, kind="stable")
+    comp_vals = hard_comp[order]
+    sorted_fk, sorted_dc, sorted_poly = hard_fk[order], hard_dc[order], hard_poly[order]
 
     # Also score Easy with the same normalization
-    easy_composites = [composite(s) for s in easy_scores]
+    easy_composites = composite(easy_fk, easy_dc, easy_poly)
 
     print(f"\n  Composite score distribution:")
-    print(f"    Easy:  mean={statistics.mean(easy_composites):.2f}  median={statistics.median(easy_composites):.2f}")
-    print(f"    Hard:  mean={statistics.mean(comp_vals):.2f}  median={statistics.median(comp_vals):.2f}")
+    print(f"    Easy:  mean={easy_composites.mean():.2f}  median={np.median(easy_composites):.2f}")
+    print(f"    Hard:  mean={comp_vals.mean():.2f}  median={np.median(comp_vals):.2f}")
 
     # Show what different percentile cutoffs yield
     print(f"\n{'=' * 78}")
@@ -176,28 +188,23 @@ def main():
           f"  vs Easy FK  vs Easy D-C")
     print(f"  {'─' * 76}")
 
-    easy_fk_mean = statistics.mean([s["fk"] for s in easy_scores])
-    easy_dc_mean = statistics.mean([s["dc"] for s in easy_scores])
-    easy_poly_mean = statistics.mean([s["pct_poly"] for s in easy_scores])
+    easy_fk_mean = easy_fk.mean()
+    easy_dc_mean = easy_dc.mean()
+    easy_poly_mean = easy_poly.mean()
 
     # Reference: Easy
     print(f"  {'Easy':>8s} {len(easy_scores):>11,} {'':>8s}"
           f" {easy_fk_mean:>8.2f} {easy_dc_mean:>9.2f} {easy_poly_mean:>8.1%}")
 
     for pctile in [5, 10, 15, 20, 25, 30, 35, 40, 50]:
-        n = int(len(hard_composites) * pctile / 100)
+        n = int(len(comp_vals) * pctile / 100)
         if n == 0:
             continue
-        subset = hard_composites[:n]
-        max_comp = subset[-1][1]
+        max_comp = comp_vals[n - 1]
 
-        fk_vals = [s["fk"] for _, _, s in subset]
-        dc_vals = [s["dc"] for _, _, s in subset]
-        poly_vals = [s["pct_poly"] for _, _, s in subset]
-
-        fk_m = statistics.mean(fk_vals)
-        dc_m = statistics.mean(dc_vals)
-        poly_m = statistics.mean(poly_vals)
+        fk_m = sorted_fk[:n].mean()
+        dc_m = sorted_dc[:n].mean()
+        poly_m = sorted_poly[:n].mean()
 
         fk_gap = fk_m - easy_fk_mean
         dc_gap = dc_m - easy_dc_mean
@@ -213,21 +220,16 @@ def main():
 
     # Detailed profile of a promising cutoff (20th percentile)
     for pick in [15, 20, 25]:
-        n = int(len(hard_composites) * pick / 100)
-        subset = hard_composites[:n]
-
-        fk_vals = [s["fk"] for _, _, s in subset]
-        dc_vals = [s["dc"] for _, _, s in subset]
-        poly_vals = [s["pct_poly"] for _, _, s in subset]
+        n = int(len(comp_vals) * pick / 100)
 
         print(f"\n{'─' * 78}")
         print(f"  DETAILED PROFILE: Bottom {pick}% of Hard corpus ({n:,} articles)")
         print(f"{'─' * 78}")
 
         for label, vals, e_vals in [
-            ("FK Grade", fk_vals, [s["fk"] for s in easy_scores]),
-            ("Dale-Chall", dc_vals, [s["dc"] for s in easy_scores]),
-            ("% Polysyllabic", poly_vals, [s["pct_poly"] for s in easy_scores]),
+            ("FK Grade", sorted_fk[:n], easy_fk),
+            ("Dale-Chall", sorted_dc[:n], easy_dc),
+            ("% Polysyllabic", sorted_poly[:n], easy_poly),
         ]:
             sm = summarize(vals)
             se = summarize(e_vals)
@@ -240,11 +242,11 @@ def main():
     print(f"\n{'=' * 78}")
     print(f"  WHERE EASY ARTICLES FALL IN HARD COMPOSITE DISTRIBUTION")
     print(f"{'=' * 78}")
-    easy_below = [0] * len(easy_composites)
-    for i, ec in enumerate(easy_composites):
-        # What percentile of Hard would this Easy article be?
-        rank = sum(1 for c in comp_vals if c <= ec)
-        easy_below[i] = rank / len(comp_vals) * 100
+    # What percentile of Hard would each Easy article be? comp_vals is
+    # sorted, so the count of Hard composites <= each Easy one is a
+    # right-side binary search.
+    ranks = np.searchsorted(comp_vals, easy_composites, side="right")
+    easy_below = ranks / len(comp_vals) * 100
     eb = summarize(easy_below)
     print(f"\n  Easy articles' percentile rank in Hard composite:")
     print(f"    Mean: {eb['mean']:.1f}%ile  Median: {eb['median']:.1f}%ile")
@@ -252,6 +254,5 @@ def main():
     print(f"\n  Interpretation: the median Easy article is easier than")
     print(f"  {eb['median']:.0f}% of Hard articles by this composite.")
 
-
 if __name__ == "__main__":
     main()